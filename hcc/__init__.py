@@ -3,11 +3,14 @@
 This package provides the Channel class for making HTTP requests with retry functionality.
 """
 
+from importlib import import_module
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Iterable, Optional
+import atexit
 import logging
+import queue
 
-from .channel import Channel
-from .single_request import get, post, put, delete, patch, request
-from .retry import retry_function, RetryPolicy
+from .retry import retry_function, retry_function_async, RetryPolicy
 from .custom_data_types import DataType, JsonType, HeaderType
 from .exceptions import (
     HccRequestError,
@@ -20,14 +23,21 @@ from .exceptions import (
 )
 
 __all__ = [
+    "AsyncBatchChannel",
+    "AsyncChannel",
     "Channel",
+    "KeepAliveAdapter",
     "get",
     "post",
     "put",
     "delete",
     "patch",
     "request",
+    "enable_async_logging",
+    "disable_async_logging",
+    "flush_logs",
     "retry_function",
+    "retry_function_async",
     "RetryPolicy",
     "DataType",
     "JsonType",
@@ -42,9 +52,116 @@ __all__ = [
 ]
 
 
+# Attributes resolved lazily by __getattr__, mapped to their defining submodule.
+_LAZY_IMPORTS = {
+    "AsyncBatchChannel": ".async_batch_channel",
+    "AsyncChannel": ".async_channel",
+    "Channel": ".channel",
+    "KeepAliveAdapter": ".channel",
+    "get": ".single_request",
+    "post": ".single_request",
+    "put": ".single_request",
+    "delete": ".single_request",
+    "patch": ".single_request",
+    "request": ".single_request",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily imports the heavier attributes of the package (PEP 562).
+
+    Channel and the single_request helpers pull in the `requests` machinery and
+    AsyncChannel the optional httpx dependency, so they are only imported when
+    first accessed; importing `hcc` for its exceptions or RetryPolicy stays cheap.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
 def initialize_logging() -> None:
     """Initialize logging for the hcc package."""
     logging.getLogger("hcc").addHandler(logging.NullHandler())
 
 
 initialize_logging()
+
+
+# State of the optional queue-backed logging; both are None while it is disabled.
+_LOG_LISTENER: Optional[QueueListener] = None
+_LOG_QUEUE_HANDLER: Optional[QueueHandler] = None
+
+
+def enable_async_logging(handlers: Optional[Iterable[logging.Handler]] = None) -> None:
+    """Moves the handling of hcc's log records onto a background thread.
+
+    Every request and retry attempt emits log records synchronously on the calling
+    thread; if a configured handler is a slow sink (network logger, rotating file on
+    slow disk), that blocking I/O sits inside the retry loop. This attaches a
+    `QueueHandler` to the "hcc" logger, so the request thread only pays an enqueue
+    cost, and starts a `QueueListener` thread that forwards the records to `handlers`.
+
+    Args:
+        handlers: The handlers the listener thread forwards the records to (default is
+            None, which snapshots the root logger's current handlers; handlers added to
+            the root logger afterwards are not picked up, so configure logging — e.g.
+            `logging.basicConfig` — before enabling).
+
+    While enabled, the "hcc" logger does not propagate to the root logger, so records
+    are not handled twice. If the forwarded handler set is empty (the root logger has
+    no handlers yet and none were passed), propagation is left on instead, so records
+    are not silently discarded. Records still in the queue at interpreter exit are
+    flushed by an atexit hook; call `flush_logs` to force a flush earlier. Calling
+    this when already enabled is a no-op.
+    """
+    global _LOG_LISTENER, _LOG_QUEUE_HANDLER  # pylint: disable=global-statement
+    if _LOG_LISTENER is not None:
+        return
+    if handlers is None:
+        handlers = logging.getLogger().handlers
+    handlers = tuple(handlers)
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _LOG_QUEUE_HANDLER = QueueHandler(log_queue)
+    _LOG_LISTENER = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _LOG_LISTENER.start()
+    hcc_logger = logging.getLogger("hcc")
+    hcc_logger.addHandler(_LOG_QUEUE_HANDLER)
+    if handlers:
+        hcc_logger.propagate = False
+
+
+def flush_logs() -> None:
+    """Blocks until every log record enqueued so far has been handled.
+
+    Does nothing when async logging is not enabled (synchronous handlers need no
+    flushing).
+    """
+    if _LOG_LISTENER is not None:
+        # stop() joins the listener thread after it has drained the queue;
+        # restarting it resumes the background handling.
+        _LOG_LISTENER.stop()
+        _LOG_LISTENER.start()
+
+
+def disable_async_logging() -> None:
+    """Restores synchronous log handling, flushing the pending records first.
+
+    Calling this when async logging is not enabled is a no-op. Registered as an
+    atexit hook, so pending records are not lost at interpreter exit.
+    """
+    global _LOG_LISTENER, _LOG_QUEUE_HANDLER  # pylint: disable=global-statement
+    if _LOG_LISTENER is None:
+        return
+    hcc_logger = logging.getLogger("hcc")
+    if _LOG_QUEUE_HANDLER is not None:
+        hcc_logger.removeHandler(_LOG_QUEUE_HANDLER)
+    hcc_logger.propagate = True
+    _LOG_LISTENER.stop()
+    _LOG_LISTENER = None
+    _LOG_QUEUE_HANDLER = None
+
+
+atexit.register(disable_async_logging)
@@ -0,0 +1,211 @@
+"""This module defines the AsyncBatchChannel class, a batching layer over AsyncChannel.
+
+The AsyncBatchChannel class coalesces bursts of concurrent requests into batches: callers
+that `await channel.get()` within a small time window are submitted together with
+`asyncio.gather`, so they multiplex over the client's pooled connections (one connection
+when HTTP/2 is negotiated) instead of racing for them one by one.
+
+The `httpx` package is an optional dependency; install it with `pip install hcc[async]`.
+"""
+
+from typing import Any, List, Optional, Iterable, Set, Tuple
+import asyncio
+import logging
+
+import httpx
+
+from .async_channel import AsyncChannel
+from .retry import RetryPolicy
+
+
+logger = logging.getLogger("hcc.request")
+
+# One queued request: the (method, url, kwargs) spec and the future its caller awaits.
+_QueueItem = Tuple[Tuple[str, str, dict], "asyncio.Future[httpx.Response]"]
+
+
+class AsyncBatchChannel(AsyncChannel):
+    """The AsyncBatchChannel class coalesces concurrent requests into batched submissions.
+
+    It behaves exactly like the AsyncChannel class (same verb methods, same retry
+    behavior), but instead of issuing each request as soon as it is awaited, requests are
+    enqueued and drained by a dispatcher task. The dispatcher collects everything that
+    arrives within `batch_window_ms` (or up to `max_batch_size` requests, whichever comes
+    first) and issues the whole batch with `asyncio.gather`, then fans the responses back
+    out to the awaiting callers. The window is adaptive in the simple sense: a batch that
+    is already full is flushed immediately, without waiting out the window.
+
+    HTTP/2 is enabled by default, so a batch multiplexes over a single connection instead
+    of occupying one pooled connection per request.
+
+    In addition to the AsyncChannel parameters, the AsyncBatchChannel class takes:
+        batch_window_ms: How long the dispatcher waits for more requests to join a batch,
+                         in milliseconds (default is 2).
+        max_batch_size: The maximum number of requests issued in one batch (default is 16).
+        http2: Whether to negotiate HTTP/2 (default is True, unlike AsyncChannel).
+
+    Typical usage example:
+    ```python
+    import asyncio
+    from hcc import AsyncBatchChannel
+
+    async def main():
+        async with AsyncBatchChannel(url="https://api.example.com") as channel:
+            responses = await asyncio.gather(*(channel.get() for _ in range(100)))
+            print([response.status_code for response in responses])
+
+    asyncio.run(main())
+    ```
+    """
+
+    __slots__ = (
+        "batch_window_ms",
+        "max_batch_size",
+        "_queue",
+        "_dispatcher_task",
+        "_batch_tasks",
+        "_closed",
+    )
+
+    def __init__(
+        self,
+        *,
+        url: str,
+        timeout: float = 2.0,
+        max_retry_count: Optional[int] = 5,
+        retry_policy: Optional[RetryPolicy] = None,
+        base_delay: Optional[int] = None,
+        success_status_codes: Optional[Iterable[int]] = None,
+        batch_window_ms: int = 2,
+        max_batch_size: int = 16,
+        http2: bool = True,
+        client: Optional["httpx.AsyncClient"] = None,
+    ):
+        super().__init__(
+            url=url,
+            timeout=timeout,
+            max_retry_count=max_retry_count,
+            retry_policy=retry_policy,
+            base_delay=base_delay,
+            success_status_codes=success_status_codes,
+            http2=http2,
+            client=client,
+        )
+        self.batch_window_ms = batch_window_ms
+        self.max_batch_size = max_batch_size
+        # The queue and the dispatcher task are bound to the running event loop, so they
+        # are created lazily by the first request instead of in the constructor.
+        self._queue: Optional["asyncio.Queue[_QueueItem]"] = None
+        self._dispatcher_task: Optional["asyncio.Task[None]"] = None
+        self._batch_tasks: Set["asyncio.Task[None]"] = set()
+        self._closed = False
+
+    async def aclose(self) -> None:
+        """Stops the dispatcher task and closes the underlying client.
+
+        Requests made after closing (including retries that were sleeping while the
+        channel closed) are rejected with a RuntimeError. Injected (shared) clients are
+        left open for their other users.
+        """
+        self._closed = True
+        if self._dispatcher_task is not None:
+            self._dispatcher_task.cancel()
+            try:
+                await self._dispatcher_task
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher_task = None
+            self._queue = None
+        if self._batch_tasks:
+            # Let the in-flight batches finish, so their callers' futures resolve
+            # before the client is closed under them.
+            await asyncio.gather(*self._batch_tasks)
+        await super().aclose()
+
+    async def _make_request(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> "httpx.Response":
+        """The _make_request private method enqueues a request and awaits its response.
+
+        The actual submission (including the exception mapping) happens in the dispatcher
+        task, which issues whole batches through `AsyncChannel._make_request`. Each retry
+        attempt passes through here again, so retries join the batches of their era
+        instead of bypassing the coalescing.
+
+        Args:
+            method: The HTTP method to be used (GET, POST, PUT, DELETE, PATCH).
+            url: The URL to which the requests will be sent.
+            **kwargs: Additional arguments for the request, such as timeout, data, json, headers.
+
+        Returns:
+            The HTTP response from the request.
+
+        Raises:
+            RuntimeError: If the channel has been closed.
+            Exception: If the request fails.
+        """
+        if self._closed:
+            # A retry sleeping through aclose() would otherwise resurrect the
+            # dispatcher on the closed client.
+            raise RuntimeError("channel is closed")
+        loop = asyncio.get_running_loop()
+        if self._dispatcher_task is None or self._dispatcher_task.done():
+            self._queue = asyncio.Queue()
+            self._dispatcher_task = loop.create_task(self._run_dispatcher())
+        future: "asyncio.Future[httpx.Response]" = loop.create_future()
+        assert self._queue is not None
+        self._queue.put_nowait(((method, url, kwargs), future))
+        return await future
+
+    async def _run_dispatcher(self) -> None:
+        """The _run_dispatcher private method drains the queue in batches, forever.
+
+        It blocks on the first queued request, then gives concurrent awaiters one
+        `batch_window_ms` window to join the batch (skipped when the queue already holds a
+        full batch), and hands the collected requests to an `_issue_batch` task. Issuing
+        each batch in its own task lets the dispatcher return to draining the queue
+        immediately, so batches pipeline instead of serializing behind the slowest
+        request of the one in flight. The task runs until it is cancelled by `aclose`.
+        """
+        queue = self._queue
+        assert queue is not None
+        loop = asyncio.get_running_loop()
+        batch_tasks = self._batch_tasks
+        window_in_seconds = self.batch_window_ms / 1000.0
+        max_batch_size = self.max_batch_size
+        while True:
+            batch = [await queue.get()]
+            if queue.qsize() + 1 < max_batch_size and window_in_seconds > 0:
+                await asyncio.sleep(window_in_seconds)
+            while len(batch) < max_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            # Keep a reference until the task completes; the loop only holds
+            # weak references to its tasks.
+            task = loop.create_task(self._issue_batch(batch))
+            batch_tasks.add(task)
+            task.add_done_callback(batch_tasks.discard)
+
+    async def _issue_batch(self, batch: List[_QueueItem]) -> None:
+        """The _issue_batch private method sends one batch and fans out the results.
+
+        The batch is issued with `asyncio.gather`, and each caller's future is resolved
+        with its response or exception; futures whose callers have been cancelled in the
+        meantime are skipped.
+        """
+        results = await asyncio.gather(
+            *(
+                AsyncChannel._make_request(self, method, url, **kwargs)
+                for (method, url, kwargs), _ in batch
+            ),
+            return_exceptions=True,
+        )
+        for (_, future), result in zip(batch, results):
+            if future.cancelled():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
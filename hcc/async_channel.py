@@ -0,0 +1,475 @@
+"""This module defines the AsyncChannel class, the asyncio counterpart of Channel.
+
+The AsyncChannel class provides coroutine methods for sending HTTP requests (GET, POST, PUT,
+DELETE, PATCH) with the same automatic retry behavior as Channel, but driven by an
+`httpx.AsyncClient`, so a single thread can keep many requests in flight concurrently.
+
+The `httpx` package is an optional dependency; install it with `pip install hcc[async]`.
+"""
+
+from types import TracebackType
+from typing import Any, Callable, Iterable, Optional, Dict
+import logging
+
+try:
+    import httpx
+except ImportError as import_error:  # pragma: no cover
+    raise ImportError(
+        "AsyncChannel requires the optional httpx dependency; "
+        "install it with: pip install hcc[async]"
+    ) from import_error
+
+from .retry import retry_function_async, RetryPolicy
+from .custom_data_types import DataType, JsonType, HeaderType
+from .exceptions import (
+    HccRequestError,
+    ConnectTimeout,
+    RequestError,
+    ReadTimeout,
+    RequestException,
+    UnknownRequestException,
+)
+
+
+logger = logging.getLogger("hcc.request")
+
+_INFO = logging.INFO
+
+# Methods that carry a request body (and therefore require data or json).
+_BODY_METHODS = frozenset({"post", "put", "patch"})
+
+# Maps `httpx` exception types onto the `hcc` exception hierarchy, mirroring the
+# `_EXC_MAP` in `channel.py`. Built once at import time so no exception-type
+# tuples are constructed per failed request.
+_EXC_MAP: dict[type[BaseException], type[HccRequestError]] = {
+    httpx.ConnectTimeout: ConnectTimeout,
+    httpx.ReadTimeout: ReadTimeout,
+    httpx.TooManyRedirects: RequestError,
+    httpx.DecodingError: RequestError,
+    httpx.HTTPError: RequestException,
+}
+
+
+class AsyncChannel:
+    """The AsyncChannel class is the asyncio counterpart of the Channel class.
+
+    It provides coroutine methods for sending GET, POST, PUT, DELETE, and PATCH requests,
+    with automatic retry in case of failure (determined by status codes). The retry delays
+    are awaited with `asyncio.sleep`, so other tasks keep running while a request backs off,
+    and independent requests can be issued concurrently with `asyncio.gather`.
+
+    Each AsyncChannel holds a persistent `httpx.AsyncClient`, so repeated calls (including
+    retries) reuse the pooled connections. The client can be released explicitly with
+    `aclose()`, or automatically by using the AsyncChannel as an async context manager.
+
+    The AsyncChannel class takes the following parameters:
+        url: The URL to which the requests will be sent.
+        timeout: The timeout for the requests (default is 2.0 seconds).
+        max_retry_count: The maximum number of retries for failed requests (default is 5).
+                         If set to None, there is no limit on the number of retries.
+        retry_policy: The retry policy for failed requests (default is None).
+        base_delay: The base delay for retries in milliseconds (default is None).
+        success_status_codes: The status codes that count as a success and stop the
+                              retrying (default is None, which means every 2xx
+                              response is accepted).
+        http2: Whether to negotiate HTTP/2, which multiplexes concurrent requests over a
+               single connection (default is False). Requires the `h2` package
+               (`pip install httpx[http2]`).
+        client: An existing `httpx.AsyncClient` to send the requests through (default is
+                None). If set to None, the AsyncChannel creates and owns its own client;
+                an injected client is shared, so `aclose()` leaves it open.
+
+    Note that `is_retry_needed` is bound to `success_status_codes` at construction time;
+    callers replacing `success_status_codes` afterwards must also rebind `is_retry_needed`.
+
+    Typical usage example:
+    ```python
+    import asyncio
+    from hcc import AsyncChannel
+
+    async def main():
+        async with AsyncChannel(url="https://api.example.com") as channel:
+            responses = await asyncio.gather(channel.get(), channel.get())
+            print([response.json() for response in responses])
+
+    asyncio.run(main())
+    ```
+    """
+
+    __slots__ = (
+        "url",
+        "timeout",
+        "max_retry_count",
+        "retry_policy",
+        "base_delay",
+        "success_status_codes",
+        "is_retry_needed",
+        "_client",
+        "_owns_client",
+    )
+
+    # Maps the supported HTTP methods to forwarders that pass on exactly the
+    # keyword arguments the corresponding public verb method accepts. A single
+    # dict lookup replaces a cascade of string comparisons in `request`.
+    _METHOD_DISPATCH: Dict[str, Callable[..., Any]] = {
+        "GET": lambda self, params, data, json, headers: self.get(
+            params=params, headers=headers
+        ),
+        "POST": lambda self, params, data, json, headers: self.post(
+            data=data, json=json, headers=headers
+        ),
+        "PUT": lambda self, params, data, json, headers: self.put(
+            data=data, json=json, headers=headers
+        ),
+        "DELETE": lambda self, params, data, json, headers: self.delete(
+            headers=headers
+        ),
+        "PATCH": lambda self, params, data, json, headers: self.patch(
+            data=data, json=json, headers=headers
+        ),
+    }
+
+    def __init__(
+        self,
+        *,
+        url: str,
+        timeout: float = 2.0,
+        max_retry_count: Optional[int] = 5,
+        retry_policy: Optional[RetryPolicy] = None,
+        base_delay: Optional[int] = None,
+        success_status_codes: Optional[Iterable[int]] = None,
+        http2: bool = False,
+        client: Optional["httpx.AsyncClient"] = None,
+    ):
+        self.url = url
+        self.timeout = timeout
+        self.max_retry_count = max_retry_count
+        self.retry_policy = retry_policy
+        self.base_delay = base_delay
+        self.is_retry_needed: Callable[["httpx.Response"], bool]
+        self.success_status_codes: Optional[frozenset[int]]
+        if success_status_codes is None:
+            # Any 2xx response is a valid HTTP success; a single range compare is
+            # also cheaper than a container membership test.
+            self.success_status_codes = None
+            self.is_retry_needed = (
+                lambda response: not 200 <= response.status_code < 300
+            )
+        else:
+            # Close over the frozenset directly: the predicate runs on every retry
+            # decision and should not dereference self on each call.
+            self.success_status_codes = frozenset(success_status_codes)
+            _success_status_codes = self.success_status_codes
+            self.is_retry_needed = (
+                lambda response: response.status_code not in _success_status_codes
+            )
+        self._owns_client = client is None
+        if client is None:
+            client = httpx.AsyncClient(timeout=timeout, http2=http2)
+        self._client = client
+        if logger.isEnabledFor(_INFO):
+            logger.info(
+                (
+                    "AsyncChannel created: id: %s, URL: %s, timeout: %s, "
+                    "max_retry_count: %s, retry_policy: %s, base_delay: %s"
+                ),
+                id(self),
+                self.url,
+                self.timeout,
+                self.max_retry_count,
+                self.retry_policy,
+                self.base_delay,
+            )
+
+    async def aclose(self) -> None:
+        """Closes the underlying client and releases its pooled connections.
+
+        Injected (shared) clients are left open for their other users.
+        """
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncChannel":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    async def get(
+        self,
+        *,
+        params: Optional[Dict[str, str]] = None,
+        headers: Optional[HeaderType] = None,
+    ) -> "httpx.Response":
+        """The get method sends a GET request.
+
+        Args:
+            params: The query parameters for the request (default is an empty dictionary).
+            headers: The headers for the request (default is an empty dictionary).
+
+        Returns:
+            The HTTP response from the first successful or last request.
+
+        Raises:
+            Exception: If the maximum retry count is reached and the request still fails.
+        """
+        return await self._dispatch("get", params=params, headers=headers)
+
+    async def post(
+        self,
+        *,
+        data: Optional[DataType] = None,
+        json: Optional[JsonType] = None,
+        headers: Optional[HeaderType] = None,
+    ) -> "httpx.Response":
+        """The post method sends a POST request.
+
+        Args:
+            data: The data to be sent in the body of the request (default is None).
+                Either this or `json` should be provided.
+            json: The JSON data to be sent in the body of the request (default is None).
+                Either this or `data` should be provided.
+            headers: The headers for the request (default is an empty dictionary).
+
+        Returns:
+            The HTTP response from the first successful or last request.
+
+        Raises:
+            Exception: If the maximum retry count is reached and the request still fails.
+        """
+        return await self._dispatch("post", data=data, json=json, headers=headers)
+
+    async def put(
+        self,
+        *,
+        data: Optional[DataType] = None,
+        json: Optional[JsonType] = None,
+        headers: Optional[HeaderType] = None,
+    ) -> "httpx.Response":
+        """The put method sends a PUT request.
+
+        Args:
+            data: The data to be sent in the body of the request (default is None).
+                Either this or `json` should be provided.
+            json: The JSON data to be sent in the body of the request (default is None).
+                Either this or `data` should be provided.
+            headers: The headers for the request (default is an empty dictionary).
+
+        Returns:
+            The HTTP response from the first successful or last request.
+
+        Raises:
+            Exception: If the maximum retry count is reached and the request still fails.
+        """
+        return await self._dispatch("put", data=data, json=json, headers=headers)
+
+    async def delete(
+        self,
+        *,
+        headers: Optional[HeaderType] = None,
+    ) -> "httpx.Response":
+        """The delete method sends a DELETE request.
+
+        Args:
+            headers: The headers for the request (default is an empty dictionary).
+
+        Returns:
+            The HTTP response from the first successful or last request.
+
+        Raises:
+            Exception: If the maximum retry count is reached and the request still fails.
+        """
+        return await self._dispatch("delete", headers=headers)
+
+    async def patch(
+        self,
+        *,
+        data: Optional[DataType] = None,
+        json: Optional[JsonType] = None,
+        headers: Optional[HeaderType] = None,
+    ) -> "httpx.Response":
+        """The patch method sends a PATCH request.
+
+        Args:
+            data: The data to be sent in the body of the request (default is None).
+                Either this or `json` should be provided.
+            json: The JSON data to be sent in the body of the request (default is None).
+                Either this or `data` should be provided.
+            headers: The headers for the request (default is an empty dictionary).
+
+        Returns:
+            The HTTP response from the first successful or last request.
+
+        Raises:
+            Exception: If the maximum retry count is reached and the request still fails.
+        """
+        return await self._dispatch("patch", data=data, json=json, headers=headers)
+
+    async def request(
+        self,
+        *,
+        method: str,
+        params: Optional[Dict[str, str]] = None,
+        data: Optional[DataType] = None,
+        json: Optional[JsonType] = None,
+        headers: Optional[HeaderType] = None,
+    ) -> "httpx.Response":
+        """The request method sends a request with the specified method.
+
+        Args:
+            method: The HTTP method to be used (GET, POST, PUT, DELETE, PATCH).
+            params: The query parameters for the request (default is an empty dictionary).
+            data: The data to be sent in the body of the request (default is None).
+                Either this or `json` should be provided.
+            json: The JSON data to be sent in the body of the request (default is None).
+                Either this or `data` should be provided.
+            headers: The headers for the request (default is an empty dictionary).
+
+        Returns:
+            The HTTP response from the first successful or last request.
+
+        Raises:
+            Exception: If the maximum retry count is reached and the request still fails.
+        """
+        method = method.upper()
+        try:
+            dispatch = self._METHOD_DISPATCH[method]
+        except KeyError:
+            raise ValueError(f"Unsupported method: {method}") from None
+        response: httpx.Response = await dispatch(self, params, data, json, headers)
+        return response
+
+    async def _dispatch(
+        self,
+        method: str,
+        *,
+        params: Optional[Dict[str, str]] = None,
+        data: Optional[DataType] = None,
+        json: Optional[JsonType] = None,
+        headers: Optional[HeaderType] = None,
+    ) -> "httpx.Response":
+        """The _dispatch private method sends a request with the given method through the
+        retry loop.
+
+        It centralizes the argument defaulting, the request body validation, the logging and
+        the `retry_function_async` wiring that is shared by all public verb methods.
+
+        Args:
+            method: The HTTP method to be used, in lowercase (get, post, put, delete, patch).
+            params: The query parameters for the request (GET only).
+            data: The data to be sent in the body of the request (POST, PUT and PATCH only).
+            json: The JSON data to be sent in the body of the request (POST, PUT and PATCH only).
+            headers: The headers for the request (default is an empty dictionary).
+
+        Returns:
+            The HTTP response from the first successful or last request.
+
+        Raises:
+            Exception: If the maximum retry count is reached and the request still fails.
+        """
+        method_name = method.upper()
+        log_info = logger.isEnabledFor(_INFO)
+        url = self.url
+        timeout = self.timeout
+        is_retry_needed = self.is_retry_needed
+        max_retry_count = self.max_retry_count
+        retry_policy = self.retry_policy
+        base_delay = self.base_delay
+        if headers is None:
+            headers = {}
+        kwargs: dict[str, Any] = {"timeout": timeout, "headers": headers}
+        if method in _BODY_METHODS:
+            assert data is not None or json is not None, (
+                "Either data or json must be provided"
+            )
+            assert data is None or json is None, (
+                "Only one of data or json can be provided"
+            )
+            if json:
+                data = None
+            kwargs["data"] = data
+            kwargs["json"] = json
+            if log_info:
+                logger.info(
+                    "%s request: channel: %s, data: %s, json: %s, headers: %s",
+                    method_name,
+                    id(self),
+                    data,
+                    json,
+                    headers,
+                )
+        elif method == "get":
+            if params is None:
+                params = {}
+            kwargs["params"] = params
+            if log_info:
+                logger.info(
+                    "%s request: channel: %s, params: %s, headers: %s",
+                    method_name,
+                    id(self),
+                    params,
+                    headers,
+                )
+        elif log_info:
+            logger.info(
+                "%s request: channel: %s, headers: %s",
+                method_name,
+                id(self),
+                headers,
+            )
+        response = await retry_function_async(
+            func=self._make_request,
+            args=(method, url),
+            kwargs=kwargs,
+            is_retry_needed=is_retry_needed,
+            max_retry_count=max_retry_count,
+            retry_policy=retry_policy,
+            base_delay=base_delay,
+        )
+        if log_info:
+            logger.info("%s response: %s", method_name, response)
+        return response
+
+    async def _make_request(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> "httpx.Response":
+        """The _make_request private method sends a request and transforms exceptions
+        if necessary.
+
+        The `httpx` exceptions are mapped onto the same `hcc` exception hierarchy as the
+        `requests` exceptions in `Channel`:
+        - `ConnectTimeout`: mapped to `hcc.ConnectTimeout`
+        - `ReadTimeout`: mapped to `hcc.ReadTimeout`
+        - `TooManyRedirects`: mapped to `hcc.RequestError`
+        - `DecodingError`: mapped to `hcc.RequestError`
+        - `HTTPError`: mapped to `hcc.RequestException` (and matched last, through the
+            MRO walk, because it's a superclass of all of `httpx` package's request
+            exceptions)
+
+        Args:
+            method: The HTTP method to be used (GET, POST, PUT, DELETE, PATCH).
+            url: The URL to which the requests will be sent.
+            **kwargs: Additional arguments for the request, such as timeout, data, json, headers.
+
+        Returns:
+            The HTTP response from the request.
+
+        Raises:
+            Exception: If the request fails.
+        """
+        try:
+            return await self._client.request(method, url, **kwargs)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            for cls in type(e).__mro__:
+                mapped = _EXC_MAP.get(cls)
+                if mapped is not None:
+                    raise mapped from e
+            raise UnknownRequestException from e
@@ -5,12 +5,18 @@ The Channel class provides methods for sending HTTP requests (GET, POST, PUT, DE
 and automatically retries requests in case of failure, based on a configurable retry policy.
 """
 
-from typing import Any, Callable, Optional, Dict
+from types import TracebackType
+from typing import Any, Callable, Iterable, Optional, Dict
 import logging
+import socket
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util import Retry
 from .retry import retry_function, RetryPolicy
 from .custom_data_types import DataType, JsonType, HeaderType
 from .exceptions import (
+    HccRequestError,
     ConnectTimeout,
     RequestError,
     JSONDecodeError,
@@ -22,6 +28,92 @@ from .exceptions import (
 
 logger = logging.getLogger("hcc.request")
 
+_INFO = logging.INFO
+
+# Sizing of the per-Channel connection pool. Retries are handled by
+# `retry_function`, so the adapter itself must not retry.
+_POOL_CONNECTIONS = 10
+_POOL_MAXSIZE = 20
+
+# Default TCP keepalive probe timings, in seconds/probes. Firewalls and NATs
+# commonly evict idle connections after 60-300s; probing every 45s keeps the
+# pooled sockets' mappings alive between request bursts.
+_TCP_KEEPIDLE = 45
+_TCP_KEEPINTVL = 15
+_TCP_KEEPCNT = 4
+
+# Methods that carry a request body (and therefore require data or json).
+_BODY_METHODS = frozenset({"post", "put", "patch"})
+
+# Methods the transport-level urllib3 Retry is allowed to replay when
+# offload_retries is enabled.
+_RETRY_ALLOWED_METHODS = frozenset({"GET", "POST", "PUT", "DELETE", "PATCH"})
+
+# Maps `requests` exception types onto the `hcc` exception hierarchy. Built once
+# at import time; `_make_request` walks the raised exception's MRO, so subclasses
+# map through their nearest listed ancestor and no except-clause chain has to be
+# evaluated per failure.
+_EXC_MAP: Dict[type[BaseException], type[HccRequestError]] = {
+    requests.ConnectTimeout: ConnectTimeout,
+    requests.FileModeWarning: RequestError,
+    requests.HTTPError: RequestError,
+    requests.TooManyRedirects: RequestError,
+    requests.JSONDecodeError: JSONDecodeError,
+    requests.ReadTimeout: ReadTimeout,
+    requests.RequestException: RequestException,
+}
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """An HTTPAdapter that enables TCP keepalive probes on the pooled sockets.
+
+    Idle pooled connections otherwise sit silent between request bursts, and
+    firewalls, NATs and load balancers routinely evict such connections; the next
+    request then hits a dead socket, fails and re-handshakes. The keepalive probes
+    keep the intermediaries' mappings alive, so the pooling savings survive idle
+    periods.
+
+    The adapter takes the following parameters (besides the HTTPAdapter ones):
+        tcp_keepidle: Idle seconds before the first keepalive probe (default is 45).
+        tcp_keepintvl: Seconds between subsequent probes (default is 15).
+        tcp_keepcnt: Number of unanswered probes before the connection is declared
+                     dead (default is 4).
+
+    The `TCP_KEEPIDLE`, `TCP_KEEPINTVL` and `TCP_KEEPCNT` socket constants are not
+    available on every platform; options whose constant is missing are simply
+    skipped, leaving plain `SO_KEEPALIVE` with the OS defaults.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        tcp_keepidle: int = _TCP_KEEPIDLE,
+        tcp_keepintvl: int = _TCP_KEEPINTVL,
+        tcp_keepcnt: int = _TCP_KEEPCNT,
+        **kwargs: Any,
+    ):
+        socket_options = list(HTTPConnection.default_socket_options) + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            socket_options.append(
+                (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, tcp_keepidle)
+            )
+        if hasattr(socket, "TCP_KEEPINTVL"):
+            socket_options.append(
+                (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, tcp_keepintvl)
+            )
+        if hasattr(socket, "TCP_KEEPCNT"):
+            socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, tcp_keepcnt))
+        self.socket_options = socket_options
+        # HTTPAdapter.__init__ calls init_poolmanager, so socket_options must be
+        # set before delegating.
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
 
 class Channel:
     """The Channel class is a wrapper around the requests library that simplifies
@@ -31,6 +123,11 @@ class Channel:
     in case of failure (determined by status codes). The class supports configurable timeout, retry
     policies, and delay between retries.
 
+    Each Channel holds a persistent `requests.Session`, so repeated calls (including retries)
+    reuse the pooled TCP/TLS connections instead of performing a new handshake per request.
+    The session can be released explicitly with `close()`, or automatically by using the
+    Channel as a context manager.
+
     The Channel class takes the following parameters:
         url: The URL to which the requests will be sent.
         timeout: The timeout for the requests (default is 2.0 seconds).
@@ -38,6 +135,28 @@ class Channel:
                          If set to None, there is no limit on the number of retries.
         retry_policy: The retry policy for failed requests (default is None).
         base_delay: The base delay for retries in milliseconds (default is None).
+        success_status_codes: The status codes that count as a success and stop the
+                              retrying (default is None, which means every 2xx
+                              response is accepted).
+        session: An existing `requests.Session` to send the requests through (default is None).
+                 If set to None, the Channel creates and owns its own session; an injected
+                 session is shared, so `close()` leaves it open for its other users.
+        offload_retries: Whether to delegate retrying to the transport layer's
+                         `urllib3.util.Retry` instead of `retry_function` (default is False).
+                         The adapter then replays connection errors and 5xx responses with
+                         exponential backoff below the Python layer, on the pooled socket,
+                         keeping the same total attempt budget of max_retry_count;
+                         `is_retry_needed`, `retry_policy` and the per-attempt logging do
+                         not apply in this mode, and it cannot be combined with an
+                         injected session.
+        tcp_keepidle: Idle seconds before the owned session's sockets send their first
+                      TCP keepalive probe (default is 45). Align this with the local
+                      firewall's idle timeout. Does not apply to injected sessions.
+        tcp_keepintvl: Seconds between subsequent keepalive probes (default is 15).
+                       Does not apply to injected sessions.
+
+    Note that `is_retry_needed` is bound to `success_status_codes` at construction time;
+    callers replacing `success_status_codes` afterwards must also rebind `is_retry_needed`.
 
     Typical usage example:
     ```python
@@ -49,6 +168,40 @@ class Channel:
     ```
     """
 
+    __slots__ = (
+        "url",
+        "timeout",
+        "max_retry_count",
+        "retry_policy",
+        "base_delay",
+        "success_status_codes",
+        "is_retry_needed",
+        "_session",
+        "_owns_session",
+        "_offload_retries",
+    )
+
+    # Maps the supported HTTP methods to forwarders that pass on exactly the
+    # keyword arguments the corresponding public verb method accepts. A single
+    # dict lookup replaces a cascade of string comparisons in `request`.
+    _METHOD_DISPATCH: Dict[str, Callable[..., requests.Response]] = {
+        "GET": lambda self, params, data, json, headers: self.get(
+            params=params, headers=headers
+        ),
+        "POST": lambda self, params, data, json, headers: self.post(
+            data=data, json=json, headers=headers
+        ),
+        "PUT": lambda self, params, data, json, headers: self.put(
+            data=data, json=json, headers=headers
+        ),
+        "DELETE": lambda self, params, data, json, headers: self.delete(
+            headers=headers
+        ),
+        "PATCH": lambda self, params, data, json, headers: self.patch(
+            data=data, json=json, headers=headers
+        ),
+    }
+
     def __init__(
         self,
         *,
@@ -57,28 +210,100 @@ class Channel:
         max_retry_count: Optional[int] = 5,
         retry_policy: Optional[RetryPolicy] = None,
         base_delay: Optional[int] = None,
+        success_status_codes: Optional[Iterable[int]] = None,
+        session: Optional[requests.Session] = None,
+        offload_retries: bool = False,
+        tcp_keepidle: int = _TCP_KEEPIDLE,
+        tcp_keepintvl: int = _TCP_KEEPINTVL,
     ):
         self.url = url
         self.timeout = timeout
         self.max_retry_count = max_retry_count
         self.retry_policy = retry_policy
         self.base_delay = base_delay
-        self.success_status_codes = [200, 201]
-        self.is_retry_needed: Callable[[requests.Response], bool] = (
-            lambda response: response.status_code not in self.success_status_codes
-        )
-        logger.info(
-            (
-                "Channel created: id: %s, URL: %s, timeout: %s, "
-                "max_retry_count: %s, retry_policy: %s, base_delay: %s"
-            ),
-            id(self),
-            self.url,
-            self.timeout,
-            self.max_retry_count,
-            self.retry_policy,
-            self.base_delay,
-        )
+        self.is_retry_needed: Callable[[requests.Response], bool]
+        self.success_status_codes: Optional[frozenset[int]]
+        if success_status_codes is None:
+            # Any 2xx response is a valid HTTP success; a single range compare is
+            # also cheaper than a container membership test.
+            self.success_status_codes = None
+            self.is_retry_needed = (
+                lambda response: not 200 <= response.status_code < 300
+            )
+        else:
+            # Close over the frozenset directly: the predicate runs on every retry
+            # decision and should not dereference self on each call.
+            self.success_status_codes = frozenset(success_status_codes)
+            _success_status_codes = self.success_status_codes
+            self.is_retry_needed = (
+                lambda response: response.status_code not in _success_status_codes
+            )
+        self._offload_retries = offload_retries
+        self._owns_session = session is None
+        if session is None:
+            if offload_retries:
+                # `retry_function` counts max_retry_count as total attempts while
+                # urllib3's Retry counts retries after the first attempt; subtract
+                # one so flipping offload_retries keeps the same attempt budget.
+                max_retries: "int | Retry" = Retry(
+                    total=(
+                        None if max_retry_count is None else max(max_retry_count - 1, 0)
+                    ),
+                    backoff_factor=(base_delay if base_delay is not None else 200)
+                    / 1000,
+                    status_forcelist=range(500, 600),
+                    allowed_methods=_RETRY_ALLOWED_METHODS,
+                    raise_on_status=False,
+                )
+            else:
+                max_retries = 0
+            session = requests.Session()
+            adapter = KeepAliveAdapter(
+                pool_connections=_POOL_CONNECTIONS,
+                pool_maxsize=_POOL_MAXSIZE,
+                max_retries=max_retries,
+                tcp_keepidle=tcp_keepidle,
+                tcp_keepintvl=tcp_keepintvl,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        elif offload_retries:
+            raise ValueError(
+                "offload_retries cannot be combined with an injected session"
+            )
+        self._session = session
+        if logger.isEnabledFor(_INFO):
+            logger.info(
+                (
+                    "Channel created: id: %s, URL: %s, timeout: %s, "
+                    "max_retry_count: %s, retry_policy: %s, base_delay: %s"
+                ),
+                id(self),
+                self.url,
+                self.timeout,
+                self.max_retry_count,
+                self.retry_policy,
+                self.base_delay,
+            )
+
+    def close(self) -> None:
+        """Closes the underlying session and releases its pooled connections.
+
+        Injected (shared) sessions are left open for their other users.
+        """
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self) -> "Channel":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
 
     def get(
         self,
@@ -98,31 +323,7 @@ class Channel:
         Raises:
             Exception: If the maximum retry count is reached and the request still fails.
         """
-        if params is None:
-            params = {}
-        if headers is None:
-            headers = {}
-        logger.info(
-            "GET request: channel: %s, params: %s, headers: %s",
-            id(self),
-            params,
-            headers,
-        )
-        response = retry_function(
-            func=lambda: self._make_request(
-                "get",
-                self.url,
-                timeout=self.timeout,
-                params=params,
-                headers=headers,
-            ),
-            is_retry_needed=self.is_retry_needed,
-            max_retry_count=self.max_retry_count,
-            retry_policy=self.retry_policy,
-            base_delay=self.base_delay,
-        )
-        logger.info("GET response: %s", response)
-        return response
+        return self._dispatch("get", params=params, headers=headers)
 
     def post(
         self,
@@ -146,37 +347,7 @@ class Channel:
         Raises:
             Exception: If the maximum retry count is reached and the request still fails.
         """
-        assert data is not None or json is not None, (
-            "Either data or json must be provided"
-        )
-        assert data is None or json is None, "Only one of data or json can be provided"
-        if json:
-            data = None
-        if headers is None:
-            headers = {}
-        logger.info(
-            "POST request: channel: %s, data: %s, json: %s, headers: %s",
-            id(self),
-            data,
-            json,
-            headers,
-        )
-        response = retry_function(
-            func=lambda: self._make_request(
-                "post",
-                self.url,
-                timeout=self.timeout,
-                data=data,
-                json=json,
-                headers=headers,
-            ),
-            is_retry_needed=self.is_retry_needed,
-            max_retry_count=self.max_retry_count,
-            retry_policy=self.retry_policy,
-            base_delay=self.base_delay,
-        )
-        logger.info("POST response: %s", response)
-        return response
+        return self._dispatch("post", data=data, json=json, headers=headers)
 
     def put(
         self,
@@ -200,37 +371,7 @@ class Channel:
         Raises:
             Exception: If the maximum retry count is reached and the request still fails.
         """
-        assert data is not None or json is not None, (
-            "Either data or json must be provided"
-        )
-        assert data is None or json is None, "Only one of data or json can be provided"
-        if json:
-            data = None
-        if headers is None:
-            headers = {}
-        logger.info(
-            "PUT request: channel: %s, data: %s, json: %s, headers: %s",
-            id(self),
-            data,
-            json,
-            headers,
-        )
-        response = retry_function(
-            func=lambda: self._make_request(
-                "put",
-                self.url,
-                timeout=self.timeout,
-                data=data,
-                json=json,
-                headers=headers,
-            ),
-            is_retry_needed=self.is_retry_needed,
-            max_retry_count=self.max_retry_count,
-            retry_policy=self.retry_policy,
-            base_delay=self.base_delay,
-        )
-        logger.info("PUT response: %s", response)
-        return response
+        return self._dispatch("put", data=data, json=json, headers=headers)
 
     def delete(
         self,
@@ -248,27 +389,7 @@ class Channel:
         Raises:
             Exception: If the maximum retry count is reached and the request still fails.
         """
-        if headers is None:
-            headers = {}
-        logger.info(
-            "DELETE request: channel: %s, headers: %s",
-            id(self),
-            headers,
-        )
-        response = retry_function(
-            func=lambda: self._make_request(
-                "delete",
-                self.url,
-                timeout=self.timeout,
-                headers=headers,
-            ),
-            is_retry_needed=self.is_retry_needed,
-            max_retry_count=self.max_retry_count,
-            retry_policy=self.retry_policy,
-            base_delay=self.base_delay,
-        )
-        logger.info("DELETE response: %s", response)
-        return response
+        return self._dispatch("delete", headers=headers)
 
     def patch(
         self,
@@ -292,37 +413,7 @@ class Channel:
         Raises:
             Exception: If the maximum retry count is reached and the request still fails.
         """
-        assert data is not None or json is not None, (
-            "Either data or json must be provided"
-        )
-        assert data is None or json is None, "Only one of data or json can be provided"
-        if json:
-            data = None
-        if headers is None:
-            headers = {}
-        logger.info(
-            "PATCH request: channel: %s, data: %s, json: %s, headers: %s",
-            id(self),
-            data,
-            json,
-            headers,
-        )
-        response = retry_function(
-            func=lambda: self._make_request(
-                "patch",
-                self.url,
-                timeout=self.timeout,
-                data=data,
-                json=json,
-                headers=headers,
-            ),
-            is_retry_needed=self.is_retry_needed,
-            max_retry_count=self.max_retry_count,
-            retry_policy=self.retry_policy,
-            base_delay=self.base_delay,
-        )
-        logger.info("PATCH response: %s", response)
-        return response
+        return self._dispatch("patch", data=data, json=json, headers=headers)
 
     def request(
         self,
@@ -351,17 +442,107 @@ class Channel:
             Exception: If the maximum retry count is reached and the request still fails.
         """
         method = method.upper()
-        if method == "GET":
-            return self.get(params=params, headers=headers)
-        if method == "POST":
-            return self.post(data=data, json=json, headers=headers)
-        if method == "PUT":
-            return self.put(data=data, json=json, headers=headers)
-        if method == "DELETE":
-            return self.delete(headers=headers)
-        if method == "PATCH":
-            return self.patch(data=data, json=json, headers=headers)
-        raise ValueError(f"Unsupported method: {method}")
+        try:
+            dispatch = self._METHOD_DISPATCH[method]
+        except KeyError:
+            raise ValueError(f"Unsupported method: {method}") from None
+        return dispatch(self, params, data, json, headers)
+
+    def _dispatch(
+        self,
+        method: str,
+        *,
+        params: Optional[Dict[str, str]] = None,
+        data: Optional[DataType] = None,
+        json: Optional[JsonType] = None,
+        headers: Optional[HeaderType] = None,
+    ) -> requests.Response:
+        """The _dispatch private method sends a request with the given method through the retry loop.
+
+        It centralizes the argument defaulting, the request body validation, the logging and the
+        `retry_function` wiring that is shared by all public verb methods.
+
+        Args:
+            method: The HTTP method to be used, in lowercase (get, post, put, delete, patch).
+            params: The query parameters for the request (GET only).
+            data: The data to be sent in the body of the request (POST, PUT and PATCH only).
+            json: The JSON data to be sent in the body of the request (POST, PUT and PATCH only).
+            headers: The headers for the request (default is an empty dictionary).
+
+        Returns:
+            The HTTP response from the first successful or last request.
+
+        Raises:
+            Exception: If the maximum retry count is reached and the request still fails.
+        """
+        method_name = method.upper()
+        log_info = logger.isEnabledFor(_INFO)
+        # Read the channel configuration once up front; LOAD_FAST on the locals
+        # is considerably cheaper than repeated attribute lookups on self.
+        url = self.url
+        timeout = self.timeout
+        is_retry_needed = self.is_retry_needed
+        max_retry_count = self.max_retry_count
+        retry_policy = self.retry_policy
+        base_delay = self.base_delay
+        if headers is None:
+            headers = {}
+        kwargs: dict[str, Any] = {"timeout": timeout, "headers": headers}
+        if method in _BODY_METHODS:
+            assert data is not None or json is not None, (
+                "Either data or json must be provided"
+            )
+            assert data is None or json is None, (
+                "Only one of data or json can be provided"
+            )
+            if json:
+                data = None
+            kwargs["data"] = data
+            kwargs["json"] = json
+            if log_info:
+                logger.info(
+                    "%s request: channel: %s, data: %s, json: %s, headers: %s",
+                    method_name,
+                    id(self),
+                    data,
+                    json,
+                    headers,
+                )
+        elif method == "get":
+            if params is None:
+                params = {}
+            kwargs["params"] = params
+            if log_info:
+                logger.info(
+                    "%s request: channel: %s, params: %s, headers: %s",
+                    method_name,
+                    id(self),
+                    params,
+                    headers,
+                )
+        elif log_info:
+            logger.info(
+                "%s request: channel: %s, headers: %s",
+                method_name,
+                id(self),
+                headers,
+            )
+        if self._offload_retries:
+            # The adapter's urllib3 Retry replays failures below the Python layer.
+            response = self._make_request(method, url, **kwargs)
+        else:
+            response = retry_function(
+                func=self._make_request,
+                args=(method, url),
+                kwargs=kwargs,
+                is_retry_needed=is_retry_needed,
+                max_retry_count=max_retry_count,
+                retry_policy=retry_policy,
+                base_delay=base_delay,
+            )
+        if log_info:
+            logger.info("%s response: %s", method_name, response)
+        return response
 
     def _make_request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
         """The _make_request private method sends a request and transforms exceptions if necessary.
@@ -375,8 +556,9 @@ class Channel:
         - `HTTPError`: mapped to `hcc.RequestError`
         - `JSONDecodeError`: mapped to `hcc.JSONDecodeError`
         - `ReadTimeout`: mapped to `hcc.ReadTimeout`
-        - `RequestException`: mapped to `hcc.RequestException` (and put last because it's
-            a superclass of all of `requests` package's exceptions)
+        - `RequestException`: mapped to `hcc.RequestException` (and matched last, through
+            the MRO walk, because it's a superclass of all of `requests` package's
+            exceptions)
         - `Timeout`: is not mapped because it's an ancestor class of `ConnectTimeout` and
             `ReadTimeout`
         - `TooManyRedirects`: mapped to `hcc.RequestError`
@@ -395,20 +577,10 @@ class Channel:
             Exception: If the request fails.
         """
         try:
-            return requests.request(method, url, **kwargs)  # pylint: disable=missing-timeout
-        except requests.ConnectTimeout as e:
-            raise ConnectTimeout from e
-        except (
-            requests.FileModeWarning,
-            requests.HTTPError,
-            requests.TooManyRedirects,
-        ) as e:
-            raise RequestError from e
-        except requests.JSONDecodeError as e:
-            raise JSONDecodeError from e
-        except requests.ReadTimeout as e:
-            raise ReadTimeout from e
-        except requests.RequestException as e:
-            raise RequestException from e
-        except Exception as e:
+            return self._session.request(method, url, **kwargs)  # pylint: disable=missing-timeout
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            for cls in type(e).__mro__:
+                mapped = _EXC_MAP.get(cls)
+                if mapped is not None:
+                    raise mapped from e
             raise UnknownRequestException from e
@@ -6,38 +6,52 @@ class HccRequestError(IOError):
     Base class for all request related exceptions raised by `hcc`.
     """
 
+    __slots__ = ()
+
 
 class ConnectTimeout(HccRequestError):
     """
     Wrapper around the `requests.ConnectTimeout` exception.
     """
 
+    __slots__ = ()
+
 
 class RequestError(HccRequestError):
     """
     Wrapper around the otherwise unwrapped exceptions from the `requests` package.
     """
 
+    __slots__ = ()
+
 
 class JSONDecodeError(HccRequestError):
     """
     Wrapper around the `requests.JSONDecodeError` exception.
     """
 
+    __slots__ = ()
+
 
 class ReadTimeout(HccRequestError):
     """
     Wrapper around the `requests.ReadTimeout` exception.
     """
 
+    __slots__ = ()
+
 
 class RequestException(HccRequestError):
     """
     Wrapper around the `requests.RequestException` (superclass) exception.
     """
 
+    __slots__ = ()
+
 
 class UnknownRequestException(HccRequestError):
     """
     Exception for all unrecognizable request related errors.
     """
+
+    __slots__ = ()
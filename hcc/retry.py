@@ -1,21 +1,35 @@
 """Retry module for retrying functions with different policies.
 
 This module provides a retry mechanism with configurable retry policies such as immediate retry,
-linear delay, and jitter delay, allowing functions to be retried on failure until a specified
-maximum retry count is reached.
+linear delay, jitter delay, exponential backoff, and decorrelated jitter, allowing functions to
+be retried on failure until a specified maximum retry count is reached.
 """
 
 from enum import Enum
-from typing import Callable, Any, Optional
-from requests import Response
+from typing import TYPE_CHECKING, Awaitable, Callable, Any, Optional, TypeVar
+import asyncio
 import logging
 import math
 import time
 import random
 import traceback
 
+if TYPE_CHECKING:
+    from requests import Response
+
 logger = logging.getLogger("hcc.retry")
 
+_DEBUG = logging.DEBUG
+_INFO = logging.INFO
+_WARNING = logging.WARNING
+
+_T = TypeVar("_T")
+
+
+# Upper bound on the delay produced by the growing (exponential and
+# decorrelated jitter) retry policies.
+_MAX_DELAY_IN_SECONDS = 30.0
+
 
 class RetryPolicy(Enum):
     """The RetryPolicy enum defines the possible values for the retry policy.
@@ -25,20 +39,31 @@ class RetryPolicy(Enum):
     - LINEAR: Retry with a linear delay, which is equal to the base_delay.
     - JITTER: Retry with a jitter delay, which is a random value
               between 0.5 and 1.5 times the base_delay.
+    - EXPONENTIAL: Retry with a delay that doubles after every attempt,
+                   starting from the base_delay and capped at 30 seconds.
+    - DECORRELATED_JITTER: Retry with a random delay between the base_delay and
+                           three times the previous delay, capped at 30 seconds.
+                           Spreads out the retries of competing clients so they
+                           don't hit an overloaded server in synchronized waves.
     """
 
     IMMEDIATE = 1
     LINEAR = 2
     JITTER = 3
+    EXPONENTIAL = 4
+    DECORRELATED_JITTER = 5
 
 
 def retry_function(
-    func: Callable[[], Response],
+    func: Callable[..., "Response"],
     is_retry_needed: Callable[[Any], bool],
     max_retry_count: Optional[int] = None,
     retry_policy: Optional[RetryPolicy] = RetryPolicy.LINEAR,
     base_delay: Optional[int] = 200,
-) -> Response:
+    *,
+    args: tuple[Any, ...] = (),
+    kwargs: Optional[dict[str, Any]] = None,
+) -> "Response":
     """Retry a function with different policies.
 
     Args:
@@ -48,6 +73,11 @@ def retry_function(
                          If set to None, there is no limit on the number of retries.
         retry_policy: The retry policy (default is RetryPolicy.LINEAR).
         base_delay: The base delay in milliseconds (default is 200).
+        args: The positional arguments passed to `func` on every attempt (default is an
+              empty tuple). Passing the arguments here instead of binding them into a
+              closure avoids allocating a new function object per call.
+        kwargs: The keyword arguments passed to `func` on every attempt (default is None,
+                which means no keyword arguments).
 
     Returns:
         The result of the function after the first successful call or the last call.
@@ -58,69 +88,326 @@ def retry_function(
     _max_retry_count = max_retry_count if max_retry_count is not None else math.inf
     _base_delay = base_delay if base_delay is not None else 200
     _base_delay_in_seconds = _base_delay / 1000
+    _kwargs = kwargs if kwargs is not None else {}
+    # The policy cannot change between attempts, so resolve it into a single
+    # callable up front instead of re-branching on every loop iteration.
+    sleep_between_attempts = _resolve_sleep_function(
+        retry_policy,
+        _base_delay_in_seconds,
+    )
     attempt = 0
     while True:
         result = None
         attempt += 1
         try:
-            result = func()
+            result = func(*args, **_kwargs)
         except Exception as e:  # pylint: disable=broad-exception-caught
+            # Extract the pieces of the description once and hand them to the
+            # logging library's lazy %-formatting, instead of eagerly building the
+            # `convert_exception_to_string` f-string; nothing is computed when the
+            # warning level is disabled.
+            log_warning = logger.isEnabledFor(_WARNING)
+            if log_warning:
+                exc_type = type(e)
+                exc_fullname = f"{exc_type.__module__}.{exc_type.__qualname__}"
             if attempt == _max_retry_count:
+                if logger.isEnabledFor(_DEBUG):
+                    logger.debug(
+                        "Attempt %d/%d returning with exception: %s",
+                        attempt,
+                        _max_retry_count,
+                        _LazyDetail(e),
+                    )
+                if log_warning:
+                    logger.warning(
+                        "Attempt %d/%d returning with exception: "
+                        "exception: %r (aka: %s), context: %s",
+                        attempt,
+                        _max_retry_count,
+                        e,
+                        exc_fullname,
+                        e.__context__,
+                    )
+                raise e
+            if logger.isEnabledFor(_DEBUG):
                 logger.debug(
-                    "Attempt %d/%d returning with exception: %s",
+                    "Attempt %d/%d failed with exception: %s",
                     attempt,
                     _max_retry_count,
-                    convert_exception_to_detailed_string(e),
+                    _LazyDetail(e),
                 )
+            if log_warning:
                 logger.warning(
-                    "Attempt %d/%d returning with exception: %s",
+                    "Attempt %d/%d failed with exception: "
+                    "exception: %r (aka: %s), context: %s",
                     attempt,
                     _max_retry_count,
-                    convert_exception_to_string(e),
+                    e,
+                    exc_fullname,
+                    e.__context__,
                 )
-                raise e
-            logger.debug(
-                "Attempt %d/%d failed with exception: %s",
-                attempt,
-                _max_retry_count,
-                convert_exception_to_detailed_string(e),
-            )
-            logger.warning(
-                "Attempt %d/%d failed with exception: %s",
-                attempt,
-                _max_retry_count,
-                convert_exception_to_string(e),
-            )
         else:
             if attempt == _max_retry_count:
+                if logger.isEnabledFor(_INFO):
+                    logger.info(
+                        "Attempt %d/%d returning with: %s",
+                        attempt,
+                        _max_retry_count,
+                        result,
+                    )
+                return result
+            if not is_retry_needed(result):
+                if logger.isEnabledFor(_INFO):
+                    logger.info(
+                        "Attempt %d/%d returning with: %s",
+                        attempt,
+                        _max_retry_count,
+                        result,
+                    )
+                return result
+            if logger.isEnabledFor(_INFO):
                 logger.info(
-                    "Attempt %d/%d returning with: %s",
+                    "Attempt %d/%d failed with error result: %s",
                     attempt,
                     _max_retry_count,
                     result,
                 )
+        if attempt < _max_retry_count:
+            sleep_between_attempts(attempt)
+
+
+async def retry_function_async(
+    func: Callable[..., Awaitable[_T]],
+    is_retry_needed: Callable[[Any], bool],
+    max_retry_count: Optional[int] = None,
+    retry_policy: Optional[RetryPolicy] = RetryPolicy.LINEAR,
+    base_delay: Optional[int] = 200,
+    *,
+    args: tuple[Any, ...] = (),
+    kwargs: Optional[dict[str, Any]] = None,
+) -> _T:
+    """Retry a coroutine function with different policies.
+
+    The asynchronous counterpart of `retry_function`: the delays between attempts
+    are awaited with `asyncio.sleep`, so other tasks on the event loop keep
+    running while this one backs off.
+
+    Args:
+        func: The coroutine function to be retried.
+        is_retry_needed: The function that determines if a retry is needed.
+        max_retry_count: The maximum number of retries (default is None).
+                         If set to None, there is no limit on the number of retries.
+        retry_policy: The retry policy (default is RetryPolicy.LINEAR).
+        base_delay: The base delay in milliseconds (default is 200).
+        args: The positional arguments passed to `func` on every attempt (default is an
+              empty tuple).
+        kwargs: The keyword arguments passed to `func` on every attempt (default is None,
+                which means no keyword arguments).
+
+    Returns:
+        The result of the function after the first successful call or the last call.
+
+    Raises:
+        Exception: If the maximum retry count is reached and the function still fails.
+    """
+    _max_retry_count = max_retry_count if max_retry_count is not None else math.inf
+    _base_delay = base_delay if base_delay is not None else 200
+    _base_delay_in_seconds = _base_delay / 1000
+    _kwargs = kwargs if kwargs is not None else {}
+    delay_between_attempts = _resolve_delay_function(
+        retry_policy,
+        _base_delay_in_seconds,
+    )
+    attempt = 0
+    while True:
+        result = None
+        attempt += 1
+        try:
+            result = await func(*args, **_kwargs)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Extract the pieces of the description once and hand them to the
+            # logging library's lazy %-formatting, instead of eagerly building the
+            # `convert_exception_to_string` f-string; nothing is computed when the
+            # warning level is disabled.
+            log_warning = logger.isEnabledFor(_WARNING)
+            if log_warning:
+                exc_type = type(e)
+                exc_fullname = f"{exc_type.__module__}.{exc_type.__qualname__}"
+            if attempt == _max_retry_count:
+                if logger.isEnabledFor(_DEBUG):
+                    logger.debug(
+                        "Attempt %d/%d returning with exception: %s",
+                        attempt,
+                        _max_retry_count,
+                        _LazyDetail(e),
+                    )
+                if log_warning:
+                    logger.warning(
+                        "Attempt %d/%d returning with exception: "
+                        "exception: %r (aka: %s), context: %s",
+                        attempt,
+                        _max_retry_count,
+                        e,
+                        exc_fullname,
+                        e.__context__,
+                    )
+                raise e
+            if logger.isEnabledFor(_DEBUG):
+                logger.debug(
+                    "Attempt %d/%d failed with exception: %s",
+                    attempt,
+                    _max_retry_count,
+                    _LazyDetail(e),
+                )
+            if log_warning:
+                logger.warning(
+                    "Attempt %d/%d failed with exception: "
+                    "exception: %r (aka: %s), context: %s",
+                    attempt,
+                    _max_retry_count,
+                    e,
+                    exc_fullname,
+                    e.__context__,
+                )
+        else:
+            if attempt == _max_retry_count:
+                if logger.isEnabledFor(_INFO):
+                    logger.info(
+                        "Attempt %d/%d returning with: %s",
+                        attempt,
+                        _max_retry_count,
+                        result,
+                    )
                 return result
             if not is_retry_needed(result):
+                if logger.isEnabledFor(_INFO):
+                    logger.info(
+                        "Attempt %d/%d returning with: %s",
+                        attempt,
+                        _max_retry_count,
+                        result,
+                    )
+                return result
+            if logger.isEnabledFor(_INFO):
                 logger.info(
-                    "Attempt %d/%d returning with: %s",
+                    "Attempt %d/%d failed with error result: %s",
                     attempt,
                     _max_retry_count,
                     result,
                 )
-                return result
-            logger.info(
-                "Attempt %d/%d failed with error result: %s",
-                attempt,
-                _max_retry_count,
-                result,
-            )
         if attempt < _max_retry_count:
-            if retry_policy == RetryPolicy.IMMEDIATE:
-                pass
-            elif retry_policy == RetryPolicy.LINEAR:
-                time.sleep(_base_delay_in_seconds)
-            elif retry_policy == RetryPolicy.JITTER:
-                time.sleep(_base_delay_in_seconds * random.uniform(0.5, 1.5))
+            delay = delay_between_attempts(attempt)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+
+def _resolve_delay_function(
+    retry_policy: Optional[RetryPolicy],
+    base_delay_in_seconds: float,
+) -> Callable[[int], float]:
+    """Resolves a retry policy into a function that computes the policy's delay.
+
+    Args:
+        retry_policy: The retry policy to resolve. None behaves like
+                      RetryPolicy.IMMEDIATE, i.e. no delay between attempts.
+        base_delay_in_seconds: The base delay in seconds.
+
+    Returns:
+        A function that maps the number of the attempt that just failed to the
+        delay in seconds to wait before the next attempt.
+    """
+    if retry_policy == RetryPolicy.LINEAR:
+
+        def delay_linear(_attempt: int) -> float:
+            return base_delay_in_seconds
+
+        return delay_linear
+    if retry_policy == RetryPolicy.JITTER:
+        # random.random is a C-level method, unlike random.uniform which adds a
+        # Python frame; half + base * random() equals base * uniform(0.5, 1.5).
+        _random = random.random
+        _half_delay = base_delay_in_seconds * 0.5
+
+        def delay_jitter(_attempt: int) -> float:
+            return _half_delay + base_delay_in_seconds * _random()
+
+        return delay_jitter
+    if retry_policy == RetryPolicy.EXPONENTIAL:
+
+        def delay_exponential(attempt: int) -> float:
+            # 2.0 rather than 2: int ** int is typed Any in typeshed, which
+            # would defeat the declared float return type.
+            return min(
+                _MAX_DELAY_IN_SECONDS, base_delay_in_seconds * 2.0 ** (attempt - 1)
+            )
+
+        return delay_exponential
+    if retry_policy == RetryPolicy.DECORRELATED_JITTER:
+        _random = random.random
+        previous_delay = base_delay_in_seconds
+
+        def delay_decorrelated_jitter(_attempt: int) -> float:
+            nonlocal previous_delay
+            previous_delay = min(
+                _MAX_DELAY_IN_SECONDS,
+                base_delay_in_seconds
+                + (previous_delay * 3 - base_delay_in_seconds) * _random(),
+            )
+            return previous_delay
+
+        return delay_decorrelated_jitter
+
+    def no_delay(_attempt: int) -> float:
+        return 0.0
+
+    return no_delay
+
+
+def _resolve_sleep_function(
+    retry_policy: Optional[RetryPolicy],
+    base_delay_in_seconds: float,
+) -> Callable[[int], None]:
+    """Resolves a retry policy into a function that sleeps the policy's delay.
+
+    Args:
+        retry_policy: The retry policy to resolve. None behaves like
+                      RetryPolicy.IMMEDIATE, i.e. no delay between attempts.
+        base_delay_in_seconds: The base delay in seconds.
+
+    Returns:
+        A function that, when called with the number of the attempt that just
+        failed, sleeps for the delay dictated by the policy.
+    """
+    if retry_policy is None or retry_policy == RetryPolicy.IMMEDIATE:
+
+        def sleep_immediate(_attempt: int) -> None:
+            pass
+
+        return sleep_immediate
+    _delay = _resolve_delay_function(retry_policy, base_delay_in_seconds)
+    _sleep = time.sleep
+
+    def sleep_for_policy(attempt: int) -> None:
+        _sleep(_delay(attempt))
+
+    return sleep_for_policy
+
+
+class _LazyDetail:
+    """Defers `convert_exception_to_detailed_string` until the log record is emitted.
+
+    The logging library only calls `__str__` on its arguments when a handler actually
+    formats the record, so the expensive traceback walk is skipped entirely when the
+    record is filtered out.
+    """
+
+    __slots__ = ("e",)
+
+    def __init__(self, e: Exception):
+        self.e = e
+
+    def __str__(self) -> str:
+        return convert_exception_to_detailed_string(self.e)
 
 
 def convert_exception_to_string(e: Exception) -> str:
@@ -133,9 +420,10 @@ def convert_exception_to_string(e: Exception) -> str:
         A string containing the name of the exception class (in two formats)
         and a readable context.
     """
+    exc_type = type(e)
     return (
         f"exception: {repr(e)} "
-        f"(aka: {e.__class__.__module__ + '.' + e.__class__.__name__}), "
+        f"(aka: {exc_type.__module__}.{exc_type.__qualname__}), "
         f"context: {e.__context__}"
     )
 
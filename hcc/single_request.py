@@ -1,16 +1,49 @@
 """This module defines methods for making HTTP requests.
 
-When making multiple requests towards an URL, consider using the `Channel` class.
+All methods send their requests through a lazily created, module-level
+`requests.Session`, so back-to-back calls towards the same host reuse the
+pooled TCP/TLS connections. When making multiple requests towards an URL,
+consider using the `Channel` class.
 """
 
 from typing import Optional, Dict
+import atexit
 import requests
 
-from .channel import Channel
+from .channel import Channel, KeepAliveAdapter, _POOL_CONNECTIONS, _POOL_MAXSIZE
 from .retry import RetryPolicy
 from .custom_data_types import DataType, JsonType, HeaderType
 
 
+_SHARED_SESSION: Optional[requests.Session] = None
+
+
+def _get_shared_session() -> requests.Session:
+    """Returns the module-level session, creating it on first use."""
+    global _SHARED_SESSION  # pylint: disable=global-statement
+    if _SHARED_SESSION is None:
+        _SHARED_SESSION = requests.Session()
+        adapter = KeepAliveAdapter(
+            pool_connections=_POOL_CONNECTIONS,
+            pool_maxsize=_POOL_MAXSIZE,
+            max_retries=0,
+        )
+        _SHARED_SESSION.mount("http://", adapter)
+        _SHARED_SESSION.mount("https://", adapter)
+    return _SHARED_SESSION
+
+
+def _close_shared_session() -> None:
+    """Closes the module-level session and its pooled sockets, if it exists."""
+    global _SHARED_SESSION  # pylint: disable=global-statement
+    if _SHARED_SESSION is not None:
+        _SHARED_SESSION.close()
+        _SHARED_SESSION = None
+
+
+atexit.register(_close_shared_session)
+
+
 def get(
     *,
     url: str,
@@ -45,6 +78,7 @@ def get(
         max_retry_count=max_retry_count,
         retry_policy=retry_policy,
         base_delay=base_delay,
+        session=_get_shared_session(),
     ).get(
         params=params,
         headers=headers,
@@ -89,6 +123,7 @@ def post(
         max_retry_count=max_retry_count,
         retry_policy=retry_policy,
         base_delay=base_delay,
+        session=_get_shared_session(),
     ).post(
         data=data,
         json=json,
@@ -134,6 +169,7 @@ def put(
         max_retry_count=max_retry_count,
         retry_policy=retry_policy,
         base_delay=base_delay,
+        session=_get_shared_session(),
     ).put(
         data=data,
         json=json,
@@ -173,6 +209,7 @@ def delete(
         max_retry_count=max_retry_count,
         retry_policy=retry_policy,
         base_delay=base_delay,
+        session=_get_shared_session(),
     ).delete(
         headers=headers,
     )
@@ -216,6 +253,7 @@ def patch(
         max_retry_count=max_retry_count,
         retry_policy=retry_policy,
         base_delay=base_delay,
+        session=_get_shared_session(),
     ).patch(
         data=data,
         json=json,
@@ -265,6 +303,7 @@ def request(
         max_retry_count=max_retry_count,
         retry_policy=retry_policy,
         base_delay=base_delay,
+        session=_get_shared_session(),
     ).request(
         method=method,
         params=params,
@@ -0,0 +1,194 @@
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+from unittest.mock import patch, AsyncMock, Mock
+import asyncio
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from hcc import AsyncBatchChannel, RetryPolicy  # noqa: E402
+
+MAX_RETRY_COUNT = 5
+
+
+def test_async_batch_channel_concurrent_requests():
+    async def scenario():
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_method:
+            mock_method.return_value = Mock(status_code=200)
+            async with AsyncBatchChannel(
+                url="https://mockserver.com/success", http2=False
+            ) as channel:
+                responses = await asyncio.gather(*(channel.get() for _ in range(10)))
+            return responses, mock_method
+
+    responses, mock_method = asyncio.run(scenario())
+    assert [response.status_code for response in responses] == [200] * 10
+    assert mock_method.call_count == 10
+
+
+def test_async_batch_channel_retries_through_batches():
+    async def scenario():
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_method:
+            mock_method.side_effect = [
+                Mock(status_code=500),
+                Mock(status_code=500),
+                Mock(status_code=200),
+            ]
+            async with AsyncBatchChannel(
+                url="https://mockserver.com/success_on_third_time",
+                max_retry_count=MAX_RETRY_COUNT,
+                base_delay=1,
+                http2=False,
+            ) as channel:
+                response = await channel.get()
+            return response, mock_method
+
+    response, mock_method = asyncio.run(scenario())
+    assert response.status_code == 200
+    assert mock_method.call_count == 3
+
+
+def test_async_batch_channel_respects_max_batch_size():
+    batch_sizes = []
+    original_gather = asyncio.gather
+
+    def recording_gather(*coroutines, **kwargs):
+        batch_sizes.append(len(coroutines))
+        return original_gather(*coroutines, **kwargs)
+
+    async def scenario():
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_method:
+            mock_method.return_value = Mock(status_code=200)
+            async with AsyncBatchChannel(
+                url="https://mockserver.com/success",
+                max_batch_size=4,
+                http2=False,
+            ) as channel:
+                with patch("hcc.async_batch_channel.asyncio.gather", recording_gather):
+                    await original_gather(*(channel.get() for _ in range(10)))
+
+    asyncio.run(scenario())
+    assert sum(batch_sizes) == 10
+    assert max(batch_sizes) <= 4
+
+
+def test_async_batch_channel_aclose_stops_dispatcher():
+    async def scenario():
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_method:
+            mock_method.return_value = Mock(status_code=200)
+            channel = AsyncBatchChannel(
+                url="https://mockserver.com/success", http2=False
+            )
+            await channel.get()
+            dispatcher_task = channel._dispatcher_task  # pylint: disable=protected-access
+            await channel.aclose()
+            return dispatcher_task, channel
+
+    dispatcher_task, channel = asyncio.run(scenario())
+    assert dispatcher_task.cancelled()
+    assert channel._dispatcher_task is None  # pylint: disable=protected-access
+
+
+def test_async_batch_channel_propagates_exceptions():
+    from hcc import exceptions
+
+    async def scenario():
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_method:
+            mock_method.side_effect = httpx.ConnectError("refused")
+            async with AsyncBatchChannel(
+                url="https://mockserver.com/fail",
+                max_retry_count=1,
+                http2=False,
+            ) as channel:
+                await channel.get()
+
+    with pytest.raises(exceptions.RequestException):
+        asyncio.run(scenario())
+
+
+def test_async_batch_channel_mixed_batch_results():
+    from hcc import exceptions
+
+    async def scenario():
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_method:
+            mock_method.side_effect = [
+                Mock(status_code=200),
+                httpx.ConnectError("refused"),
+            ]
+            async with AsyncBatchChannel(
+                url="https://mockserver.com/mixed",
+                max_retry_count=1,
+                http2=False,
+            ) as channel:
+                results = await asyncio.gather(
+                    channel.get(), channel.get(), return_exceptions=True
+                )
+            return results
+
+    results = asyncio.run(scenario())
+    statuses = [
+        result.status_code
+        for result in results
+        if not isinstance(result, BaseException)
+    ]
+    errors = [result for result in results if isinstance(result, BaseException)]
+    assert statuses == [200]
+    assert len(errors) == 1
+    assert isinstance(errors[0], exceptions.RequestException)
+
+
+def test_async_batch_channel_skips_cancelled_callers():
+    async def scenario():
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_method:
+            mock_method.return_value = Mock(status_code=200)
+            async with AsyncBatchChannel(
+                url="https://mockserver.com/success", http2=False
+            ) as channel:
+                doomed = asyncio.create_task(channel.get())
+                await asyncio.sleep(0)  # let the request reach the queue
+                doomed.cancel()
+                response = await channel.get()
+            assert doomed.cancelled()
+            return response
+
+    response = asyncio.run(scenario())
+    assert response.status_code == 200
+
+
+def test_async_batch_channel_aclose_waits_for_inflight_batch():
+    async def scenario():
+        async def slow_request(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return Mock(status_code=200)
+
+        with patch("httpx.AsyncClient.request", new=slow_request):
+            channel = AsyncBatchChannel(url="https://mockserver.com/slow", http2=False)
+            task = asyncio.create_task(channel.get())
+            await asyncio.sleep(0.02)  # the batch is issued and in flight
+            await channel.aclose()
+            return await task
+
+    response = asyncio.run(scenario())
+    assert response.status_code == 200
+
+
+def test_async_batch_channel_rejects_requests_after_aclose():
+    async def scenario():
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_method:
+            mock_method.return_value = Mock(status_code=500)
+            channel = AsyncBatchChannel(
+                url="https://mockserver.com/fail",
+                max_retry_count=2,
+                retry_policy=RetryPolicy.LINEAR,
+                base_delay=50,
+                http2=False,
+            )
+            task = asyncio.create_task(channel.get())
+            await asyncio.sleep(0.02)  # first attempt failed, retry is sleeping
+            await channel.aclose()
+            with pytest.raises(RuntimeError, match="channel is closed"):
+                await task
+            assert channel._dispatcher_task is None  # pylint: disable=protected-access
+
+    asyncio.run(scenario())
@@ -0,0 +1,261 @@
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+from unittest import TestCase
+from unittest.mock import patch, AsyncMock, Mock
+import asyncio
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from hcc import AsyncChannel  # noqa: E402
+
+MAX_RETRY_COUNT = 5
+
+
+def run_test(method: str, side_effects, data=None):
+    async def scenario():
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_method:
+            mock_method.side_effect = side_effects
+            async with AsyncChannel(
+                url="https://mockserver.com/success",
+                max_retry_count=MAX_RETRY_COUNT,
+                base_delay=1,
+            ) as channel:
+                method_to_call = getattr(channel, method)
+                if method in ["post", "put", "patch"]:
+                    response = await method_to_call(data=data)
+                else:
+                    response = await method_to_call()
+            return response, mock_method
+
+    return asyncio.run(scenario())
+
+
+def test_async_channel_get_success():
+    response, mock_get = run_test(
+        method="get",
+        side_effects=[Mock(status_code=200)],
+    )
+    assert response.status_code == 200
+    assert mock_get.call_count == 1
+
+
+def test_async_channel_get_fail():
+    response, mock_get = run_test(
+        method="get",
+        side_effects=[Mock(status_code=500)] * MAX_RETRY_COUNT,
+    )
+    assert response.status_code == 500
+    assert mock_get.call_count == MAX_RETRY_COUNT
+
+
+def test_async_channel_post_success_on_third_time():
+    response, mock_post = run_test(
+        method="post",
+        side_effects=[
+            Mock(status_code=500),
+            Mock(status_code=500),
+            Mock(status_code=201),
+        ],
+        data={},
+    )
+    assert response.status_code == 201
+    assert mock_post.call_count == 3
+
+
+def test_async_channel_concurrent_requests():
+    async def scenario():
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_method:
+            mock_method.return_value = Mock(status_code=200)
+            async with AsyncChannel(url="https://mockserver.com/success") as channel:
+                responses = await asyncio.gather(
+                    channel.get(),
+                    channel.get(),
+                    channel.delete(),
+                )
+            return responses, mock_method
+
+    responses, mock_method = asyncio.run(scenario())
+    assert [response.status_code for response in responses] == [200, 200, 200]
+    assert mock_method.call_count == 3
+
+
+def test_async_channel_unsupported_method():
+    async def scenario():
+        async with AsyncChannel(url="https://mockserver.com/success") as channel:
+            with pytest.raises(ValueError):
+                await channel.request(method="options")
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize(
+    "httpx_exception_factory, hcc_exception_name",
+    [
+        (lambda: httpx.ConnectTimeout("timeout"), "ConnectTimeout"),
+        (lambda: httpx.ReadTimeout("timeout"), "ReadTimeout"),
+        (lambda: httpx.TooManyRedirects("redirects"), "RequestError"),
+        (lambda: httpx.ConnectError("refused"), "RequestException"),
+        (lambda: Exception("unknown"), "UnknownRequestException"),
+    ],
+)
+def test_async_channel_exception_mapping(httpx_exception_factory, hcc_exception_name):
+    from hcc import exceptions
+
+    hcc_exception = getattr(exceptions, hcc_exception_name)
+
+    async def scenario():
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_method:
+            mock_method.side_effect = httpx_exception_factory()
+            async with AsyncChannel(
+                url="https://mockserver.com/success",
+                max_retry_count=1,
+            ) as channel:
+                await channel.get()
+
+    with pytest.raises(hcc_exception):
+        asyncio.run(scenario())
+
+
+def test_async_channel_put_success():
+    response, mock_put = run_test(
+        method="put",
+        side_effects=[Mock(status_code=201)],
+        data={},
+    )
+    assert response.status_code == 201
+    assert mock_put.call_count == 1
+
+
+def test_async_channel_patch_success_on_third_time():
+    response, mock_patch = run_test(
+        method="patch",
+        side_effects=[
+            Mock(status_code=500),
+            Mock(status_code=500),
+            Mock(status_code=200),
+        ],
+        data={},
+    )
+    assert response.status_code == 200
+    assert mock_patch.call_count == 3
+
+
+def test_async_channel_request_method():
+    async def scenario():
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_method:
+            mock_method.side_effect = [Mock(status_code=200)]
+            async with AsyncChannel(url="https://mockserver.com/success") as channel:
+                response = await channel.request(method="get")
+            return response, mock_method
+
+    response, mock_method = asyncio.run(scenario())
+    assert response.status_code == 200
+    assert mock_method.call_count == 1
+
+
+def test_async_channel_custom_success_status_codes():
+    async def scenario():
+        with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_method:
+            mock_method.side_effect = [
+                Mock(status_code=201),
+                Mock(status_code=200),
+            ]
+            async with AsyncChannel(
+                url="https://mockserver.com/created",
+                success_status_codes=(200,),
+                base_delay=1,
+            ) as channel:
+                response = await channel.get()
+            return response, mock_method
+
+    response, mock_method = asyncio.run(scenario())
+    assert response.status_code == 200
+    assert mock_method.call_count == 2
+
+
+class TestAsyncChannelLogging(TestCase):
+    def test_logging_on_new_async_channel(self):
+        with self.assertLogs("hcc.request", level="INFO") as context:
+            channel = AsyncChannel(url="https://mockserver.com/success")
+
+        expected_log = (
+            r"^INFO:hcc.request:AsyncChannel created: id: \d+, "
+            r"URL: https://mockserver.com/success, timeout: 2.0, "
+            r"max_retry_count: 5, retry_policy: None, base_delay: None$"
+        )
+        self.assertEqual(len(context.output), 1)
+        self.assertRegex(context.output[0], expected_log)
+        asyncio.run(channel.aclose())
+
+    def test_logging_on_async_get_request(self):
+        async def scenario():
+            with patch(
+                "httpx.AsyncClient.request", new_callable=AsyncMock
+            ) as mock_method:
+                mock_method.return_value = Mock(status_code=200)
+                async with AsyncChannel(
+                    url="https://mockserver.com/success"
+                ) as channel:
+                    with self.assertLogs("hcc.request", level="INFO") as context:
+                        await channel.get(
+                            params={"param1": "value1"},
+                            headers={"header1": "value1"},
+                        )
+                    return context
+
+        context = asyncio.run(scenario())
+        expected_request_log = (
+            r"^INFO:hcc.request:GET request: channel: \d+, "
+            r"params: {'param1': 'value1'}, headers: {'header1': 'value1'}$"
+        )
+        expected_response_log = r"^INFO:hcc.request:GET response: .+$"
+        self.assertEqual(len(context.output), 2)
+        self.assertRegex(context.output[0], expected_request_log)
+        self.assertRegex(context.output[1], expected_response_log)
+
+    def test_logging_on_async_post_request(self):
+        async def scenario():
+            with patch(
+                "httpx.AsyncClient.request", new_callable=AsyncMock
+            ) as mock_method:
+                mock_method.return_value = Mock(status_code=200)
+                async with AsyncChannel(
+                    url="https://mockserver.com/success"
+                ) as channel:
+                    with self.assertLogs("hcc.request", level="INFO") as context:
+                        await channel.post(json={"key": "value"})
+                    return context
+
+        context = asyncio.run(scenario())
+        expected_request_log = (
+            r"^INFO:hcc.request:POST request: channel: \d+, "
+            r"data: None, json: {'key': 'value'}, headers: {}$"
+        )
+        expected_response_log = r"^INFO:hcc.request:POST response: .+$"
+        self.assertEqual(len(context.output), 2)
+        self.assertRegex(context.output[0], expected_request_log)
+        self.assertRegex(context.output[1], expected_response_log)
+
+    def test_logging_on_async_delete_request(self):
+        async def scenario():
+            with patch(
+                "httpx.AsyncClient.request", new_callable=AsyncMock
+            ) as mock_method:
+                mock_method.return_value = Mock(status_code=200)
+                async with AsyncChannel(
+                    url="https://mockserver.com/success"
+                ) as channel:
+                    with self.assertLogs("hcc.request", level="INFO") as context:
+                        await channel.delete()
+                    return context
+
+        context = asyncio.run(scenario())
+        expected_request_log = (
+            r"^INFO:hcc.request:DELETE request: channel: \d+, headers: {}$"
+        )
+        expected_response_log = r"^INFO:hcc.request:DELETE response: .+$"
+        self.assertEqual(len(context.output), 2)
+        self.assertRegex(context.output[0], expected_request_log)
+        self.assertRegex(context.output[1], expected_response_log)
@@ -0,0 +1,86 @@
+# pylint: disable=C0114
+# pylint: disable=C0115
+# pylint: disable=C0116
+import logging
+
+from hcc import enable_async_logging, disable_async_logging, flush_logs
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def test_async_logging_forwards_records_to_handlers():
+    handler = ListHandler()
+    logger = logging.getLogger("hcc.retry")
+    logger.setLevel(logging.INFO)
+    try:
+        enable_async_logging(handlers=[handler])
+        logger.info("queued message")
+        flush_logs()
+        assert [record.getMessage() for record in handler.records] == ["queued message"]
+    finally:
+        disable_async_logging()
+        logger.setLevel(logging.NOTSET)
+
+
+def test_async_logging_disable_restores_synchronous_handling():
+    handler = ListHandler()
+    hcc_logger = logging.getLogger("hcc")
+    handler_count = len(hcc_logger.handlers)
+    enable_async_logging(handlers=[handler])
+    assert hcc_logger.propagate is False
+    assert len(hcc_logger.handlers) == handler_count + 1
+    disable_async_logging()
+    assert hcc_logger.propagate is True
+    assert len(hcc_logger.handlers) == handler_count
+
+
+def test_async_logging_enable_is_idempotent():
+    handler = ListHandler()
+    hcc_logger = logging.getLogger("hcc")
+    handler_count = len(hcc_logger.handlers)
+    try:
+        enable_async_logging(handlers=[handler])
+        enable_async_logging(handlers=[handler])
+        assert len(hcc_logger.handlers) == handler_count + 1
+    finally:
+        disable_async_logging()
+
+
+def test_async_logging_defaults_to_root_handler_snapshot():
+    root_logger = logging.getLogger()
+    hcc_logger = logging.getLogger("hcc")
+    handler = ListHandler()
+    root_logger.addHandler(handler)
+    try:
+        enable_async_logging()
+        assert hcc_logger.propagate is False
+    finally:
+        disable_async_logging()
+        root_logger.removeHandler(handler)
+    assert hcc_logger.propagate is True
+
+
+def test_async_logging_keeps_propagation_without_handlers():
+    hcc_logger = logging.getLogger("hcc")
+    try:
+        enable_async_logging(handlers=[])
+        # With nothing to forward to, disabling propagation would silently
+        # discard every record.
+        assert hcc_logger.propagate is True
+    finally:
+        disable_async_logging()
+
+
+def test_async_logging_disable_without_enable_is_a_noop():
+    hcc_logger = logging.getLogger("hcc")
+    handler_count = len(hcc_logger.handlers)
+    disable_async_logging()
+    assert len(hcc_logger.handlers) == handler_count
+    assert hcc_logger.propagate is True
@@ -3,6 +3,8 @@
 # pylint: disable=C0116
 from typing import Optional, List, Any
 from unittest.mock import patch, Mock
+import pytest
+import requests
 from hcc import Channel, DataType
 
 MAX_RETRY_COUNT = 5
@@ -14,7 +16,7 @@ def run_test(
     side_effects: List[Mock],
     data: Optional[DataType] = None,
 ):
-    with patch("hcc.channel.requests.request") as mock_method:
+    with patch("requests.Session.request") as mock_method:
         mock_method.side_effect = side_effects
         channel = Channel(url=url, max_retry_count=MAX_RETRY_COUNT)
         method_to_call = getattr(channel, method)
@@ -203,3 +205,103 @@ def test_channel_patch_success_on_third_time():
     )
     assert response.status_code == 200
     assert mock_patch.call_count == 3
+
+
+def test_channel_session_is_reused_across_requests():
+    with patch("requests.Session.request") as mock_method:
+        mock_method.side_effect = [Mock(status_code=200), Mock(status_code=200)]
+        channel = Channel(url="https://mockserver.com/success")
+        session = channel._session  # pylint: disable=protected-access
+        channel.get()
+        channel.get()
+        assert channel._session is session  # pylint: disable=protected-access
+
+
+def test_channel_as_context_manager():
+    with patch("requests.Session.request") as mock_method:
+        mock_method.side_effect = [Mock(status_code=200)]
+        with Channel(url="https://mockserver.com/success") as channel:
+            response = channel.get()
+        assert response.status_code == 200
+
+
+def test_channel_offload_retries_configures_adapter():
+    channel = Channel(
+        url="https://mockserver.com/success",
+        max_retry_count=3,
+        base_delay=100,
+        offload_retries=True,
+    )
+    adapter = channel._session.get_adapter(  # pylint: disable=protected-access
+        "https://mockserver.com/success"
+    )
+    # max_retry_count counts attempts; Retry.total counts retries after the
+    # first attempt.
+    assert adapter.max_retries.total == 2
+    assert adapter.max_retries.backoff_factor == 0.1
+    assert 500 in adapter.max_retries.status_forcelist
+
+
+def test_channel_offload_retries_skips_retry_function():
+    with patch("requests.Session.request") as mock_method:
+        mock_method.side_effect = [Mock(status_code=500)]
+        channel = Channel(
+            url="https://mockserver.com/fail",
+            max_retry_count=MAX_RETRY_COUNT,
+            offload_retries=True,
+        )
+        response = channel.get()
+        assert response.status_code == 500
+        assert mock_method.call_count == 1
+
+
+def test_channel_offload_retries_rejects_injected_session():
+    with pytest.raises(ValueError):
+        Channel(
+            url="https://mockserver.com/success",
+            session=requests.Session(),
+            offload_retries=True,
+        )
+
+
+def test_channel_accepts_any_2xx_by_default():
+    with patch("requests.Session.request") as mock_method:
+        mock_method.side_effect = [Mock(status_code=204)]
+        channel = Channel(url="https://mockserver.com/no_content")
+        response = channel.get()
+        assert response.status_code == 204
+        assert mock_method.call_count == 1
+
+
+def test_channel_custom_success_status_codes():
+    with patch("requests.Session.request") as mock_method:
+        mock_method.side_effect = [
+            Mock(status_code=201),
+            Mock(status_code=200),
+        ]
+        channel = Channel(
+            url="https://mockserver.com/created",
+            success_status_codes=(200,),
+        )
+        response = channel.get()
+        assert response.status_code == 200
+        assert mock_method.call_count == 2
+
+
+def test_channel_adapter_enables_tcp_keepalive():
+    import socket
+
+    channel = Channel(
+        url="https://mockserver.com/success",
+        tcp_keepidle=60,
+        tcp_keepintvl=20,
+    )
+    adapter = channel._session.get_adapter(  # pylint: disable=protected-access
+        "https://mockserver.com/success"
+    )
+    options = adapter.socket_options
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        assert (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60) in options
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        assert (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 20) in options
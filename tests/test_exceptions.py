@@ -29,7 +29,7 @@ from hcc.single_request import get
     ],
 )
 def test_exception(requests_exception: type[Exception], hcc_exception: type[Exception]):
-    with patch("hcc.channel.requests.request") as mock_method:
+    with patch("requests.Session.request") as mock_method:
         if requests_exception is requests.JSONDecodeError:
             mock_method.side_effect = requests_exception("fake_msg", "fake_doc", 0)
         else:
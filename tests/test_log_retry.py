@@ -2,8 +2,10 @@
 # pylint: disable=C0115
 # pylint: disable=C0116
 from unittest import TestCase
-from unittest.mock import Mock
-from hcc import retry_function
+from unittest.mock import Mock, AsyncMock
+import asyncio
+from hcc import retry_function, retry_function_async
+from hcc.retry import convert_exception_to_string
 
 
 class TestLogRetry(TestCase):
@@ -89,3 +91,125 @@ class TestLogRetry(TestCase):
             expected_log = "INFO:hcc.retry:Attempt 1/1 returning with: Error"
             self.assertEqual(len(context.output), 1)
             self.assertEqual(context.output[0], expected_log)
+
+    def test_logging_on_retry_function_async_exception_exhaustion(self):
+        mock_func = AsyncMock()
+        mock_func.side_effect = [Exception("Error"), Exception("Error")]
+
+        with (
+            self.assertLogs("hcc.retry", level="DEBUG") as context,
+            self.assertRaises(Exception),
+        ):
+            asyncio.run(
+                retry_function_async(
+                    func=mock_func,
+                    is_retry_needed=lambda x: True,
+                    max_retry_count=2,
+                    base_delay=1,
+                )
+            )
+
+        expected_warning = (
+            "WARNING:hcc.retry:Attempt 2/2 returning with exception: "
+            "exception: Exception('Error') (aka: builtins.Exception), context: None"
+        )
+        debug_output = [
+            output for output in context.output if output.startswith("DEBUG")
+        ]
+        self.assertEqual(len(debug_output), 2)
+        self.assertIn("Traceback (most recent call last):", debug_output[1])
+        self.assertEqual(context.output[-1], expected_warning)
+
+    def test_logging_on_retry_function_async_success(self):
+        mock_func = AsyncMock()
+        mock_func.side_effect = ["Success"]
+
+        with self.assertLogs("hcc.retry", level="INFO") as context:
+            asyncio.run(
+                retry_function_async(
+                    func=mock_func,
+                    is_retry_needed=lambda x: x != "Success",
+                    max_retry_count=5,
+                )
+            )
+
+        expected_log = "INFO:hcc.retry:Attempt 1/5 returning with: Success"
+        self.assertEqual(len(context.output), 1)
+        self.assertEqual(context.output[0], expected_log)
+
+    def test_logging_on_retry_function_async_error(self):
+        mock_func = AsyncMock()
+        mock_func.side_effect = ["Error", "Success"]
+
+        with self.assertLogs("hcc.retry", level="INFO") as context:
+            asyncio.run(
+                retry_function_async(
+                    func=mock_func,
+                    is_retry_needed=lambda x: x != "Success",
+                    max_retry_count=5,
+                    base_delay=1,
+                )
+            )
+
+        expected_log = "INFO:hcc.retry:Attempt 1/5 failed with error result: Error"
+        self.assertEqual(len(context.output), 2)
+        self.assertEqual(context.output[0], expected_log)
+
+    def test_logging_on_retry_function_async_error_return(self):
+        mock_func = AsyncMock()
+        mock_func.side_effect = ["Error"]
+
+        with self.assertLogs("hcc.retry", level="INFO") as context:
+            asyncio.run(
+                retry_function_async(
+                    func=mock_func,
+                    is_retry_needed=lambda x: x != "Success",
+                    max_retry_count=1,
+                )
+            )
+
+        expected_log = "INFO:hcc.retry:Attempt 1/1 returning with: Error"
+        self.assertEqual(len(context.output), 1)
+        self.assertEqual(context.output[0], expected_log)
+
+    def test_convert_exception_to_string(self):
+        try:
+            raise ValueError("boom")
+        except ValueError as e:
+            description = convert_exception_to_string(e)
+
+        self.assertEqual(
+            description,
+            "exception: ValueError('boom') (aka: builtins.ValueError), context: None",
+        )
+
+    def test_logging_detailed_exception_on_debug(self):
+        mock_func = Mock()
+        mock_func.side_effect = [Exception("Error"), Exception("Error")]
+
+        with (
+            self.assertLogs("hcc.retry", level="DEBUG") as context,
+            self.assertRaises(Exception),
+        ):
+            _ = retry_function(
+                func=mock_func,
+                is_retry_needed=lambda x: True,
+                max_retry_count=2,
+                retry_policy=None,
+            )
+
+        debug_output = [
+            output for output in context.output if output.startswith("DEBUG")
+        ]
+        self.assertEqual(len(debug_output), 2)
+        self.assertRegex(
+            debug_output[0],
+            r"^DEBUG:hcc.retry:Attempt 1/2 failed with exception: "
+            r"Traceback \(most recent call last\):",
+        )
+        self.assertRegex(
+            debug_output[1],
+            r"^DEBUG:hcc.retry:Attempt 2/2 returning with exception: "
+            r"Traceback \(most recent call last\):",
+        )
+        self.assertIn("Exception: Error", debug_output[0])
@@ -1,9 +1,10 @@
 # pylint: disable=C0114
 # pylint: disable=C0115
 # pylint: disable=C0116
+import asyncio
 import time
 import pytest
-from hcc.retry import retry_function, RetryPolicy
+from hcc.retry import retry_function, retry_function_async, RetryPolicy
 from .test_utilities import Counter, assert_runtime
 
 BASE_DELAY = 100
@@ -61,3 +62,48 @@ def test_retry_function_with_exceptions_eventual_success():
     expected_runtime = (3 - 1) * (BASE_DELAY / 1000)
     actual_runtime = end_time - start_time
     assert_runtime(expected_runtime, actual_runtime)
+
+
+def test_retry_function_async_with_exceptions_fail():
+    Counter.reset()
+
+    async def always_fail():
+        Counter.next()
+        raise Exception("Always fail")  # pylint: disable=broad-exception-raised
+
+    async def scenario():
+        return await retry_function_async(
+            func=always_fail,
+            is_retry_needed=lambda x: True,
+            max_retry_count=MAX_RETRIES,
+            retry_policy=RetryPolicy.LINEAR,
+            base_delay=1,
+        )
+
+    with pytest.raises(Exception, match="Always fail"):
+        asyncio.run(scenario())
+
+    assert Counter.count == MAX_RETRIES
+
+
+def test_retry_function_async_with_exceptions_eventual_success():
+    Counter.reset()
+
+    async def succeed_on_third_time():
+        val = Counter.next()
+        if val == 3:
+            return val
+        raise Exception("Fail on first two attempts")  # pylint: disable=broad-exception-raised
+
+    async def scenario():
+        return await retry_function_async(
+            func=succeed_on_third_time,
+            is_retry_needed=lambda x: False,  # Exceptions are always retried
+            max_retry_count=MAX_RETRIES,
+            retry_policy=RetryPolicy.LINEAR,
+            base_delay=1,
+        )
+
+    response = asyncio.run(scenario())
+
+    assert response == 3
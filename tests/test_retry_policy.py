@@ -114,3 +114,52 @@ def test_retry_function_fail_jitter():
         expected_runtime_middle * 1.5,
         end_time - start_time,
     )
+
+
+def test_retry_function_success_exponential():
+    start_time = time.time()
+    response = retry_function(
+        func=Counter.next,
+        is_retry_needed=RETRY_NEEDED_SUCCESS,
+        retry_policy=RetryPolicy.EXPONENTIAL,
+        max_retry_count=MAX_RETRIES,
+        base_delay=BASE_DELAY,
+    )
+    end_time = time.time()
+    assert response == RETRY_NUMBER_SUCCESS
+    expected_runtime = (1 + 2) * BASE_DELAY / 1000
+    assert_runtime(expected_runtime, end_time - start_time)
+
+
+def test_retry_function_fail_exponential():
+    start_time = time.time()
+    response = retry_function(
+        func=Counter.next,
+        is_retry_needed=RETRY_NEEDED_FAIL,
+        retry_policy=RetryPolicy.EXPONENTIAL,
+        max_retry_count=MAX_RETRIES,
+        base_delay=BASE_DELAY,
+    )
+    end_time = time.time()
+    assert response == MAX_RETRIES
+    expected_runtime = (1 + 2 + 4 + 8) * BASE_DELAY / 1000
+    assert_runtime(expected_runtime, end_time - start_time)
+
+
+def test_retry_function_success_decorrelated_jitter():
+    start_time = time.time()
+    response = retry_function(
+        func=Counter.next,
+        is_retry_needed=RETRY_NEEDED_SUCCESS,
+        retry_policy=RetryPolicy.DECORRELATED_JITTER,
+        max_retry_count=MAX_RETRIES,
+        base_delay=BASE_DELAY,
+    )
+    end_time = time.time()
+    assert response == RETRY_NUMBER_SUCCESS
+    # Each delay is between base_delay and three times the previous delay.
+    assert_runtime_interval(
+        (RETRY_NUMBER_SUCCESS - 1) * BASE_DELAY / 1000,
+        (3 + 9) * BASE_DELAY / 1000,
+        end_time - start_time,
+    )
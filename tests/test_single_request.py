@@ -73,3 +73,38 @@ def test_single_request_delete():
 
 def test_single_request_patch():
     assert_equal_requests("patch")
+
+
+def test_single_request_shared_session_is_reused():
+    from hcc import single_request
+
+    with mock_patch("requests.Session.request") as mock_request:
+        mock_request.return_value = Mock(status_code=200)
+
+        _ = get(url="https://mockserver.com/success")
+        session = single_request._SHARED_SESSION  # pylint: disable=protected-access
+        assert session is not None
+
+        _ = delete(url="https://mockserver.com/success")
+        assert single_request._SHARED_SESSION is session  # pylint: disable=protected-access
+
+
+def test_single_request_shared_session_is_closed_and_recreated():
+    from hcc import single_request
+
+    with mock_patch("requests.Session.request") as mock_request:
+        mock_request.return_value = Mock(status_code=200)
+
+        _ = get(url="https://mockserver.com/success")
+        session = single_request._SHARED_SESSION  # pylint: disable=protected-access
+        assert session is not None
+
+        single_request._close_shared_session()  # pylint: disable=protected-access
+        assert single_request._SHARED_SESSION is None  # pylint: disable=protected-access
+        # Closing again is a no-op.
+        single_request._close_shared_session()  # pylint: disable=protected-access
+
+        _ = get(url="https://mockserver.com/success")
+        new_session = single_request._SHARED_SESSION  # pylint: disable=protected-access
+        assert new_session is not None
+        assert new_session is not session